@@ -1,8 +1,14 @@
+import asyncio
+import multiprocessing
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Awaitable, Callable
 
 from pydantic import Field
 from pydantic.dataclasses import dataclass
 
+from astrbot.api import logger
 from astrbot.api.star import Context, Star, register
 from astrbot.core.agent.run_context import ContextWrapper
 from astrbot.core.agent.tool import FunctionTool, ToolExecResult
@@ -11,9 +17,133 @@ from astrbot.core.message.components import File
 from astrbot.core.message.message_event_result import MessageChain
 from astrbot.core.agent.tool import ToolSet
 
-from .utils.document_utils import DocumentManager, MarkdownToWordConverter
-from .utils.scholar import ArxivTool
-from .utils.smart_reader import smart_read_to_markdown
+from .utils.document_utils import DocumentManager, MarkdownToWordConverter, md_to_word
+from .utils.rate_limit import RequestLimiter, backoff_delay, is_rate_limited_error
+from .utils.scholar import AcademicBaseTool, ArxivTool, shutdown_parse_pool
+from .utils.semantic_cache import SemanticCache
+from .utils.smart_reader import (
+    close_browser,
+    close_http_session,
+    close_read_cache,
+    smart_read_to_markdown,
+    start_browser,
+)
+
+DOCUMENT_BASE_DIR = "./data/plugin_data/astrbot_plugin_AssistantResearchTeam"
+
+# LLM 请求遇到 429 时的最大重试次数
+LLM_MAX_RETRIES = 3
+
+# arxiv_search 返回给 LLM 的单条结果模板
+_ARXIV_RESULT_FMT = "{i}. Title: {t}\n   Authors: {a}\n   Year: {y}\n   Abstract: {ab}\n   PDF URL: {url}\n"
+
+# 查询路由：短且不含分析类意图的查询交给快速模型，其余交给强模型
+FAST_QUERY_MAX_LENGTH = 200
+_HEAVY_QUERY_RE = re.compile(
+    r"compare|analy[sz]e|deep|review|survey|research|```|\$|调研|对比|分析|综述|比较",
+    re.IGNORECASE
+)
+
+# 各工具的参数 schema 是不变的配置，集中定义在模块级便于查阅；
+# 作为可变默认值，pydantic 仍会为每个实例深拷贝一份，这里并不省去构造开销
+_GEMINI_SEARCH_PARAMS: dict = {
+    "type": "object",
+    "properties": {
+        "keywords": {
+            "type": "string",
+            "description": "Keywords or questions to search on the web.",
+        },
+    },
+    "required": ["keywords"],
+}
+
+_PARALLEL_SEARCH_PARAMS: dict = {
+    "type": "object",
+    "properties": {
+        "keywords_list": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "A list of independent keywords or questions to search on the web concurrently.",
+        },
+    },
+    "required": ["keywords_list"],
+}
+
+_ARXIV_SEARCH_PARAMS: dict = {
+    "type": "object",
+    "properties": {
+        "keywords": {
+            "type": "string",
+            "description": "Keywords to search for academic papers on arXiv.",
+        },
+        "max_results": {
+            "type": "integer",
+            "description": "Maximum number of search results to return.",
+            "default": 3,
+        }
+    },
+    "required": ["keywords", "max_results"],
+}
+
+_SMART_READER_PARAMS: dict = {
+    "type": "object",
+    "properties": {
+        "url": {
+            "type": "string",
+            "description": "The URL of the web page or PDF document to read.",
+        },
+    },
+    "required": ["url"],
+}
+
+_DOCUMENT_PROCESSOR_PARAMS: dict = {
+    "type": "object",
+    "properties": {
+        "document_type": {
+            "type": "string",
+            "description": "The type of the document to process.(markdown/docx)",
+        },
+        "document_content": {
+            "type": "string",
+            "description": "The content of the document to process. If creating a docx file, content should be in markdown format.",
+        },
+        "document_name": {
+            "type": "string",
+            "description": "The name of the document to process.",
+        },
+        "process_type": {
+            "type": "string",
+            "description": "The type of processing to perform on the document.(create/read/write(append)/write(cover)/delete/list)",
+        }
+    },
+    "required": ["document_type", "document_name", "process_type"],
+}
+
+_SEND_FILE_PARAMS: dict = {
+    "type": "object",
+    "properties": {
+        "file_path": {
+            "type": "string",
+            "description": "The absolute path of the file to send.",
+        },
+    },
+    "required": ["file_path"],
+}
+
+_DOCUMENT_REVIEWER_PARAMS: dict = {
+    "type": "object",
+    "properties": {
+        "document_name": {
+            "type": "string",
+            "description": "The name of the document to review.",
+        },
+        "question": {
+            "type": "string",
+            "description": "The question that the document answers or research is related to.",
+        },
+    },
+    "required": ["document_name", "question"],
+}
 
 
 @register("deepresearch", "miaomiao", "基于Gemini的简单deepresearch实现", "0.0.1")
@@ -23,6 +153,26 @@ class MyPlugin(Star):
         self.search_contexts: dict[str, list[dict]] = {}
         self.search_provider_id = config.get("search_provider_id", "gemini_with_search")
         self.scholar_proxy_base_url = config.get("scholar_proxy_base_url")
+        self.search_timeout = float(config.get("search_timeout", 120))
+        self.fast_provider_id = config.get("fast_provider_id", "")
+        # 所有搜索类 LLM 调用共享的并发上限和速率限制，防止嵌套 agent 扇出时触发上游限流；
+        # 允许小于 1 的速率（如免费额度的 0.2 次/秒），非正数回退到默认值
+        llm_rps = float(config.get("llm_rps", 5))
+        self.llm_limiter = RequestLimiter(
+            max_inflight=max(1, int(config.get("max_inflight_llm", 8))),
+            rps=llm_rps if llm_rps > 0 else 5.0
+        )
+        # 用于 docx 渲染等 CPU 密集型任务的进程池；
+        # 使用 spawn 启动子进程，避免在已有 Playwright/torch 线程的进程中 fork 导致死锁
+        self.cpu_pool = ProcessPoolExecutor(
+            max_workers=min(2, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        self.semantic_cache = SemanticCache(
+            threshold=float(config.get("semantic_cache_threshold", 0.92))
+        )
+        self._warmup_task: asyncio.Task | None = None
+        self._model_task: asyncio.Task | None = None
 
     async def initialize(self):
         """可选择实现异步的插件初始化方法，当实例化该插件类之后会自动调用该方法。"""
@@ -32,39 +182,81 @@ class MyPlugin(Star):
         #     print(f"  ID: {prov.meta().id}, Type: {type(prov).__name__}")
         # print("===========================")
 
-        # 注册工具
-        arxiv_tool = ArxivSearchTool()
-        arxiv_tool.proxy_base_url = self.scholar_proxy_base_url or ""
+        # 预先启动共享浏览器，smart_reader 的每次读取只需新建 BrowserContext；
+        # 启动失败（如未安装 Chromium）不影响其他工具注册，读取网页时会再次尝试启动
+        try:
+            await start_browser()
+        except Exception as e:
+            logger.warning(f"[deepresearch] 浏览器预启动失败，将在首次读取网页时重试: {e}")
+
+        # 后台加载语义缓存使用的向量模型（首次运行需要下载，可能很慢），
+        # 加载完成前语义缓存按精确匹配工作，不阻塞工具注册
+        self._model_task = asyncio.create_task(asyncio.to_thread(self.semantic_cache.load_model))
+
+        # 注册工具，工具依赖的对象只构造一次，调用时直接复用
+        arxiv = ArxivTool(proxy_base_url=self.scholar_proxy_base_url or "")
+        arxiv_tool = ArxivSearchTool(
+            proxy_base_url=self.scholar_proxy_base_url or "",
+            arxiv=arxiv,
+        )
+        # 后台预热学术代理的连接，不阻塞插件启动
+        self._warmup_task = asyncio.create_task(arxiv.warmup())
+        search_tool = GeminiSearchTool(
+            search_provider_id=self.search_provider_id,
+            fast_provider_id=self.fast_provider_id,
+            semantic_cache=self.semantic_cache,
+            llm_limiter=self.llm_limiter,
+            timeout=self.search_timeout,
+        )
+        document_tool = DocumentProcessor(
+            dm=DocumentManager(base_dir=DOCUMENT_BASE_DIR),
+            mtw=MarkdownToWordConverter(),
+            cpu_pool=self.cpu_pool,
+        )
         self.context.add_llm_tools(
-            GeminiSearchTool(),
+            search_tool,
             arxiv_tool,
             SmartReader(),
-            DocumentProcessor(),
+            document_tool,
             SendFileTool(),
-            DocumentReviewer()
+            DocumentReviewer(
+                search_tool=search_tool,
+                parallel_search_tool=ParallelSearchTool(search_tool=search_tool),
+                document_tool=document_tool
+            )
         )
 
 
     async def terminate(self):
         """可选择实现异步的插件销毁方法，当插件被卸载/停用时会调用。"""
+        for task in (self._warmup_task, self._model_task):
+            if task is not None:
+                task.cancel()
+        await close_browser()
+        await close_http_session()
+        await AcademicBaseTool.close_session()
+        ArxivTool.close_cache()
+        shutdown_parse_pool()
+        close_read_cache()
+        self.cpu_pool.shutdown(wait=False, cancel_futures=True)
+
+# 查询路由命中统计，用于调整路由阈值
+_ROUTE_STATS = {"fast": 0, "heavy": 0}
+# 每路由多少次输出一次命中率汇总
+ROUTE_STATS_LOG_EVERY = 50
 
 @dataclass
 class GeminiSearchTool(FunctionTool[AstrAgentContext]):
     name: str = "gemini_search"
     description: str = "Use Gemini's search capabilities to perform web searches and generate detailed search results for the query."
-    parameters: dict = Field(
-        default_factory=lambda: {
-            "type": "object",
-            "properties": {
-                "keywords": {
-                    "type": "string",
-                    "description": "Keywords or questions to search on the web.",
-                },
-            },
-            "required": ["keywords"],
-        }
-    )
+    parameters: dict = Field(default=_GEMINI_SEARCH_PARAMS)
     search_provider_id: str = "gemini_with_search"
+    # 处理简单事实类查询的快速模型，为空时所有查询都使用 search_provider_id
+    fast_provider_id: str = ""
+    semantic_cache: Any = None
+    llm_limiter: Any = None
+    # 单次搜索的最长等待时间（秒），超时后返回已接收到的部分结果
+    timeout: float = 120
 
     async def call(
         self, context: ContextWrapper[AstrAgentContext], **kwargs
@@ -72,39 +264,157 @@ class GeminiSearchTool(FunctionTool[AstrAgentContext]):
         keyword = kwargs.get("keywords")
         system_prompt = "You are a web search expert leveraging Gemini and Google Search, able to perform searches based on keywords or questions provided by the user and return detailed results while clearly citing their sources."
 
+        # 相同或语义相近的查询直接返回缓存结果，省去一次远程 LLM 调用
+        query_vec = None
+        if self.semantic_cache is not None:
+            query_vec = await self.semantic_cache.embed(keyword)
+            cached = await self.semantic_cache.get(keyword, vec=query_vec)
+            if cached is not None:
+                return cached
+
         # 通过 context.context.context 获取 Star 的 Context
         astrbot_context: Context = context.context.context
+        provider_id = self._choose_provider(keyword)
+
+        chunks: list[str] = []
+        try:
+            text = await asyncio.wait_for(
+                self._generate_limited(astrbot_context, provider_id, keyword, system_prompt, chunks),
+                timeout=self.timeout
+            )
+        except asyncio.TimeoutError:
+            # 超时后流已被关闭，上游停止生成；有部分结果时返回部分结果
+            if not chunks:
+                return f"Search error: no response within {self.timeout} seconds."
+            return "".join(chunks) + "\n\n[搜索结果因超时被截断]"
+
+        if self.semantic_cache is not None and text:
+            await self.semantic_cache.put(keyword, text, vec=query_vec)
+        return text
+
+    async def _generate_limited(
+        self,
+        astrbot_context: Context,
+        provider_id: str,
+        keyword: str,
+        system_prompt: str,
+        chunks: list[str]
+    ) -> str:
+        """经过并发/速率限制调用 LLM，遇到 429 时指数退避重试"""
+        for attempt in range(LLM_MAX_RETRIES + 1):
+            try:
+                if self.llm_limiter is None:
+                    return await self._generate(astrbot_context, provider_id, keyword, system_prompt, chunks)
+                async with self.llm_limiter:
+                    return await self._generate(astrbot_context, provider_id, keyword, system_prompt, chunks)
+            except Exception as e:
+                # 已经收到部分流式结果时不再重试，避免重复内容
+                if attempt >= LLM_MAX_RETRIES or chunks or not is_rate_limited_error(e):
+                    raise
+                await asyncio.sleep(backoff_delay(attempt))
+
+    def _choose_provider(self, keyword: str) -> str:
+        """按查询长度和意图选择 provider，并统计路由命中情况"""
+        if not self.fast_provider_id:
+            return self.search_provider_id
+
+        use_fast = len(keyword) < FAST_QUERY_MAX_LENGTH and not _HEAVY_QUERY_RE.search(keyword)
+        _ROUTE_STATS["fast" if use_fast else "heavy"] += 1
+        logger.debug(f"[GeminiSearchTool] Routed to {'fast' if use_fast else 'heavy'} provider")
+        total = _ROUTE_STATS["fast"] + _ROUTE_STATS["heavy"]
+        if total % ROUTE_STATS_LOG_EVERY == 0:
+            logger.info(
+                f"[GeminiSearchTool] Route stats: {_ROUTE_STATS}, "
+                f"fast ratio {_ROUTE_STATS['fast'] / total:.0%}"
+            )
+        return self.fast_provider_id if use_fast else self.search_provider_id
+
+    async def _generate(
+        self,
+        astrbot_context: Context,
+        provider_id: str,
+        keyword: str,
+        system_prompt: str,
+        chunks: list[str]
+    ) -> str:
+        """流式获取搜索结果，增量写入 chunks；provider 不支持流式时退回 llm_generate"""
+        provider = astrbot_context.get_provider_by_id(provider_id)
+        if provider is not None and hasattr(provider, "text_chat_stream"):
+            stream = provider.text_chat_stream(
+                prompt=keyword,
+                system_prompt=system_prompt,
+                contexts=[],
+            )
+            try:
+                async for llm_resp in stream:
+                    if llm_resp.is_chunk:
+                        chunks.append(llm_resp.completion_text or "")
+                    else:
+                        # 流结束时 provider 会返回一次完整结果
+                        return llm_resp.completion_text
+                return "".join(chunks)
+            except NotImplementedError:
+                pass
+            finally:
+                # 取消或超时时关闭流，让上游连接及时断开，不再继续生成
+                await stream.aclose()
 
         llm_resp = await astrbot_context.llm_generate(
-            chat_provider_id=self.search_provider_id,
+            chat_provider_id=provider_id,
             prompt=keyword,
             system_prompt=system_prompt,
             contexts=[],
         )
         return llm_resp.completion_text
 
+@dataclass
+class ParallelSearchTool(FunctionTool[AstrAgentContext]):
+    name: str = "parallel_gemini_search"
+    description: str = "Run several independent gemini_search queries concurrently and return all results at once. Prefer this over calling gemini_search repeatedly when you have multiple unrelated questions."
+    parameters: dict = Field(default=_PARALLEL_SEARCH_PARAMS)
+    search_tool: Any = None
+    max_queries: int = 5
+
+    async def call(
+        self, context: ContextWrapper[AstrAgentContext], **kwargs
+    ) -> ToolExecResult:
+        keywords_list = kwargs.get("keywords_list") or []
+        if not isinstance(keywords_list, list):
+            return "keywords_list must be an array of strings."
+        keywords_list = [k for k in keywords_list if isinstance(k, str) and k]
+        if not keywords_list:
+            return "Keywords are required."
+        # 超出上限的查询不执行，但在结果中列出，提示模型另行发起
+        skipped = keywords_list[self.max_queries:]
+        keywords_list = keywords_list[:self.max_queries]
+
+        # agent 循环会串行执行同一步中的多个工具调用，这里把多个查询合并为一次调用并发执行，
+        # 整体耗时由各查询耗时之和变为其中的最大值
+        search_tool = self.search_tool or GeminiSearchTool()
+        results = await asyncio.gather(
+            *(search_tool.call(context, keywords=keyword) for keyword in keywords_list),
+            return_exceptions=True
+        )
+
+        sections = []
+        for keyword, result in zip(keywords_list, results):
+            if isinstance(result, Exception):
+                result = f"Search error: {result}"
+            sections.append(f"## {keyword}\n\n{result}")
+        if skipped:
+            sections.append(
+                f"[Only the first {self.max_queries} queries were run; skipped: "
+                + "; ".join(skipped) + "]"
+            )
+        return "\n\n".join(sections)
+
 @dataclass
 class ArxivSearchTool(FunctionTool[AstrAgentContext]):
     name: str = "arxiv_search"
     description: str = "Use ArxivTool to search for academic papers on arXiv based on keywords."
-    parameters: dict = Field(
-        default_factory=lambda: {
-            "type": "object",
-            "properties": {
-                "keywords": {
-                    "type": "string",
-                    "description": "Keywords to search for academic papers on arXiv.",
-                },
-                "max_results": {
-                    "type": "integer",
-                    "description": "Maximum number of search results to return.",
-                    "default": 3,
-                }
-            },
-            "required": ["keywords", "max_results"],
-        }
-    )
+    parameters: dict = Field(default=_ARXIV_SEARCH_PARAMS)
     proxy_base_url: str = ""
+    arxiv: Any = None
 
     async def call(
         self, context: ContextWrapper[AstrAgentContext], **kwargs
@@ -114,7 +424,7 @@ class ArxivSearchTool(FunctionTool[AstrAgentContext]):
             return "Keywords are required."
         max_results = kwargs.get("max_results", 3)
         print(f"[ArxivSearchTool] Searching for: {keyword}, max_results: {max_results}, proxy_base_url: {self.proxy_base_url}")
-        arxiv_tool = ArxivTool(proxy_base_url=self.proxy_base_url)
+        arxiv_tool = self.arxiv or ArxivTool(proxy_base_url=self.proxy_base_url)
         results = await arxiv_tool.search(query=keyword, max_results=max_results)
         print(f"[ArxivSearchTool] Results: {results}")
 
@@ -125,28 +435,23 @@ class ArxivSearchTool(FunctionTool[AstrAgentContext]):
         if results and "error" in results[0]:
             return f"Search error: {results[0]['error']}"
 
-        response_lines = []
-        for idx, paper in enumerate(results, start=1):
-            response_lines.append(f"{idx}. Title: {paper.get('title', 'N/A')}\n   Authors: {paper.get('authors', 'N/A')}\n   Year: {paper.get('year', 'N/A')}\n   Abstract: {paper.get('abstract', 'N/A')}\n   PDF URL: {paper.get('pdf_url', 'N/A')}\n")
-
-        return "\n".join(response_lines)
+        return "\n".join(
+            _ARXIV_RESULT_FMT.format(
+                i=idx,
+                t=paper.get("title", "N/A"),
+                a=paper.get("authors", "N/A"),
+                y=paper.get("year", "N/A"),
+                ab=paper.get("abstract", "N/A"),
+                url=paper.get("pdf_url", "N/A")
+            )
+            for idx, paper in enumerate(results, start=1)
+        )
 
 @dataclass
 class SmartReader(FunctionTool[AstrAgentContext]):
     name: str = "smart_reader"
     description: str = "A tool to intelligently read and extract content from web pages or PDF documents given their URLs. It can handle dynamic web pages using a headless browser and extract text in Markdown format."
-    parameters: dict = Field(
-        default_factory=lambda: {
-            "type": "object",
-            "properties": {
-                "url": {
-                    "type": "string",
-                    "description": "The URL of the web page or PDF document to read.",
-                },
-            },
-            "required": ["url"],
-        }
-    )
+    parameters: dict = Field(default=_SMART_READER_PARAMS)
 
     async def call(
         self, context: ContextWrapper[AstrAgentContext], **kwargs
@@ -157,40 +462,76 @@ class SmartReader(FunctionTool[AstrAgentContext]):
         markdown_content = await smart_read_to_markdown(url)
         return markdown_content
 
+async def _do_create(tool, dm, mtw, document_type, document_name, document_content) -> str:
+    if document_type == "markdown":
+        filepath = await asyncio.to_thread(dm.create, document_name, document_content)
+        return f"Markdown 文件已创建: {filepath}"
+    elif document_type == "docx":
+        # docx 渲染是 CPU 密集型任务，有进程池时放到子进程中执行以绕开 GIL
+        if tool.cpu_pool is not None:
+            loop = asyncio.get_running_loop()
+            filepath = await loop.run_in_executor(
+                tool.cpu_pool, md_to_word, document_content, document_name
+            )
+        else:
+            filepath = await asyncio.to_thread(mtw.convert, document_content, document_name)
+        return f"Word 文件已创建: {filepath}"
+    else:
+        return "不支持的文档类型。"
+
+
+async def _do_read(tool, dm, mtw, document_type, document_name, document_content) -> str:
+    return await asyncio.to_thread(dm.read, document_name)
+
+
+async def _do_append(tool, dm, mtw, document_type, document_name, document_content) -> str:
+    await asyncio.to_thread(dm.write, document_name, document_content, append=True)
+    return f"文件已追加内容: {document_name}"
+
+
+async def _do_cover(tool, dm, mtw, document_type, document_name, document_content) -> str:
+    await asyncio.to_thread(dm.write, document_name, document_content, append=False)
+    return f"文件已覆盖内容: {document_name}"
+
+
+async def _do_delete(tool, dm, mtw, document_type, document_name, document_content) -> str:
+    await asyncio.to_thread(dm.delete, document_name)
+    return f"文件已删除: {document_name}"
+
+
+async def _do_list(tool, dm, mtw, document_type, document_name, document_content) -> str:
+    files = await asyncio.to_thread(dm.list_files)
+    return "md文件列表:\n" + "\n".join(files)
+
+
+async def _do_unsupported(tool, dm, mtw, document_type, document_name, document_content) -> str:
+    return "不支持的处理方法类型。"
+
+
+# process_type -> 处理函数，模块加载时构造一次
+_DOCUMENT_HANDLERS: dict[str, Callable[..., Awaitable[str]]] = {
+    "create": _do_create,
+    "read": _do_read,
+    "write(append)": _do_append,
+    "write(cover)": _do_cover,
+    "delete": _do_delete,
+    "list": _do_list,
+}
+
 @dataclass
 class DocumentProcessor(FunctionTool[AstrAgentContext]):
     name: str = "Document_Processor"
     description: str = ""
-    parameters: dict = Field(
-        default_factory=lambda: {
-            "type": "object",
-            "properties": {
-                "document_type": {
-                    "type": "string",
-                    "description": "The type of the document to process.(markdown/docx)",
-                },
-                "document_content": {
-                    "type": "string",
-                    "description": "The content of the document to process. If creating a docx file, content should be in markdown format.",
-                },
-                "document_name": {
-                    "type": "string",
-                    "description": "The name of the document to process.",
-                },
-                "process_type": {
-                    "type": "string",
-                    "description": "The type of processing to perform on the document.(create/read/write(append)/write(cover)/delete/list)",
-                }
-            },
-            "required": ["document_type", "document_name", "process_type"],
-        }
-    )
+    parameters: dict = Field(default=_DOCUMENT_PROCESSOR_PARAMS)
+    dm: Any = None
+    mtw: Any = None
+    cpu_pool: Any = None
 
     async def call(
         self, context: ContextWrapper[AstrAgentContext], **kwargs
     ) -> ToolExecResult:
-        dm = DocumentManager(base_dir="./data/plugin_data/astrbot_plugin_AssistantResearchTeam")
-        mtw = MarkdownToWordConverter()
+        dm = self.dm or DocumentManager(base_dir=DOCUMENT_BASE_DIR)
+        mtw = self.mtw or MarkdownToWordConverter()
 
         document_type = kwargs.get("document_type", "")
         document_name = kwargs.get("document_name", "")
@@ -200,50 +541,14 @@ class DocumentProcessor(FunctionTool[AstrAgentContext]):
         if not document_name:
             return "Document name is required."
 
-        match process_type:
-            case "create":
-                if document_type == "markdown":
-                    filepath = dm.create(document_name, document_content)
-                    return f"Markdown 文件已创建: {filepath}"
-                elif document_type == "docx":
-                    filepath = mtw.convert(document_content, document_name)
-                    return f"Word 文件已创建: {filepath}"
-                else:
-                    return "不支持的文档类型。"
-            case "read":
-                content = dm.read(document_name)
-                return content
-            case "write(append)":
-                dm.write(document_name, document_content, append= True)
-                return f"文件已追加内容: {document_name}"
-            case "write(cover)":
-                dm.write(document_name, document_content, append= False)
-                return f"文件已覆盖内容: {document_name}"
-            case "delete":
-                dm.delete(document_name)
-                return f"文件已删除: {document_name}"
-            case "list":
-                files = dm.list_files()
-                return "md文件列表:\n" + "\n".join(files)
-            case _:
-                return "不支持的处理方法类型。"
+        handler = _DOCUMENT_HANDLERS.get(process_type, _do_unsupported)
+        return await handler(self, dm, mtw, document_type, document_name, document_content)
 
 @dataclass
 class SendFileTool(FunctionTool[AstrAgentContext]):
     name: str = "send_file"
     description: str = "A tool to send files to the user. Use this when you need to send a generated file (like .docx, .pdf, .md) to the user."
-    parameters: dict = Field(
-        default_factory=lambda: {
-            "type": "object",
-            "properties": {
-                "file_path": {
-                    "type": "string",
-                    "description": "The absolute path of the file to send.",
-                },
-            },
-            "required": ["file_path"],
-        }
-    )
+    parameters: dict = Field(default=_SEND_FILE_PARAMS)
 
     async def call(
         self, context: ContextWrapper[AstrAgentContext], **kwargs
@@ -271,22 +576,11 @@ class SendFileTool(FunctionTool[AstrAgentContext]):
 class DocumentReviewer(FunctionTool[AstrAgentContext]):
     name: str = "document_reviewer"
     description: str = "A subaent Used to review whether the answers or research in the document are comprehensive and whether any additions are needed."
-    parameters:dict = Field(
-        default_factory=lambda: {
-            "type": "object",
-            "properties": {
-                "document_name": {
-                    "type": "string",
-                    "description": "The name of the document to review.",
-                },
-                "question": {
-                    "type": "string",
-                    "description": "The question that the document answers or research is related to.",
-                },
-            },
-            "required": ["document_name", "question"],
-        }
-    )
+    parameters: dict = Field(default=_DOCUMENT_REVIEWER_PARAMS)
+    search_tool: Any = None
+    parallel_search_tool: Any = None
+    document_tool: Any = None
+
     async def call(
             self, context: ContextWrapper[AstrAgentContext], **kwargs
             ) -> ToolExecResult:
@@ -295,14 +589,20 @@ class DocumentReviewer(FunctionTool[AstrAgentContext]):
                 Evaluate whether the answer or research in the document is comprehensive and whether it requires additional content. \
                 If supplementation is needed, please provide specific suggestions for what to add. \
                 When necessary (e.g., if you find the information ambiguous, or if the relevant knowledge is not available in your knowledge base), \
-                use the gemini_search tool to search for information on this topic and incorporate the search results into your supplementary suggestions."
+                use the gemini_search tool to search for information on this topic and incorporate the search results into your supplementary suggestions. \
+                When you need several independent searches, issue them together with the parallel_gemini_search tool instead of calling gemini_search one by one."
         astr_context = context.context.context
+        search_tool = self.search_tool or GeminiSearchTool()
         llm_resp = await astr_context.tool_loop_agent(
             contexts=[],
             chat_provider_id = review_provider_id,   # LLM provider ID
             system_prompt = (prompt),
             prompt = f"Question: {kwargs['question']}\nDocument_name: {kwargs['document_name']}",
-            tools = ToolSet([GeminiSearchTool(), DocumentProcessor()]),
+            tools = ToolSet([
+                search_tool,
+                self.parallel_search_tool or ParallelSearchTool(search_tool=search_tool),
+                self.document_tool or DocumentProcessor()
+            ]),
             max_steps = 10,
             event=context.context.event
         )
@@ -6,7 +6,10 @@
 - Markdown 转 Word 文档（保留格式）
 """
 
+import os
 import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
 from docx import Document
@@ -14,6 +17,11 @@ from docx.oxml.ns import qn
 from docx.shared import Inches, Pt
 
 
+# 内容缓存最多保留的文件数，以及单个文件可缓存的最大字节数
+CONTENT_CACHE_MAX_FILES = 32
+CONTENT_CACHE_MAX_BYTES = 1024 * 1024
+
+
 class DocumentManager:
     """文档管理器，用于管理 Markdown 文件和转换为 Word"""
 
@@ -26,6 +34,52 @@ class DocumentManager:
         """
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        # 文件索引：base_dir 下的文件名 -> (mtime_ns, size)，用于列出文件
+        self._index: dict[str, tuple[int, int]] = {}
+        # 最近读写文件的内容缓存 (LRU)：文件名 -> (mtime_ns, size, 内容)，通过 stat 校验是否过期
+        self._contents: OrderedDict[str, tuple[int, int, str]] = OrderedDict()
+        # 目录的 mtime_ns，目录内增删文件时会变化，用于判断索引是否需要重建
+        self._dir_mtime: int | None = None
+        self._index_lock = threading.Lock()
+
+    def _refresh(self):
+        """扫描目录重建索引（调用方需持有锁）"""
+        dir_mtime = os.stat(self.base_dir).st_mtime_ns
+        index = {}
+        with os.scandir(self.base_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".md") or not entry.is_file():
+                    continue
+                st = entry.stat()
+                index[entry.name] = (st.st_mtime_ns, st.st_size)
+        self._index = index
+        for name in [n for n in self._contents if n not in index]:
+            del self._contents[name]
+        self._dir_mtime = dir_mtime
+
+    def _index_key(self, filepath: Path) -> str | None:
+        """只有直接位于 base_dir 下的文件才进入索引，子目录或目录外的路径返回 None"""
+        return filepath.name if filepath.parent == self.base_dir else None
+
+    def _cache_content(self, key: str, st: os.stat_result, content: str):
+        """记录文件内容到 LRU 缓存，过大的文件不缓存（调用方需持有锁）"""
+        self._index[key] = (st.st_mtime_ns, st.st_size)
+        if st.st_size > CONTENT_CACHE_MAX_BYTES:
+            self._contents.pop(key, None)
+            return
+        self._contents[key] = (st.st_mtime_ns, st.st_size, content)
+        self._contents.move_to_end(key)
+        while len(self._contents) > CONTENT_CACHE_MAX_FILES:
+            self._contents.popitem(last=False)
+
+    def _update_index(self, filepath: Path, content: str):
+        """文件被本实例修改后更新索引（增删文件会改变目录 mtime，list_files 时自动重新扫描）"""
+        key = self._index_key(filepath)
+        if key is None:
+            return
+        st = filepath.stat()
+        with self._index_lock:
+            self._cache_content(key, st, content)
 
     def _get_path(self, filename: str) -> Path:
         """获取文件的完整路径"""
@@ -49,6 +103,7 @@ class DocumentManager:
             raise FileExistsError(f"文件已存在: {filepath}")
 
         filepath.write_text(content, encoding="utf-8")
+        self._update_index(filepath, content)
         return str(filepath)
 
     def read(self, filename: str) -> str:
@@ -62,10 +117,26 @@ class DocumentManager:
             文件内容
         """
         filepath = self._get_path(filename)
-        if not filepath.exists():
-            raise FileNotFoundError(f"文件不存在: {filepath}")
-
-        return filepath.read_text(encoding="utf-8")
+        try:
+            st = filepath.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"文件不存在: {filepath}") from None
+
+        key = self._index_key(filepath)
+        if key is None:
+            return filepath.read_text(encoding="utf-8")
+
+        # 文件未变化时直接返回缓存内容
+        with self._index_lock:
+            cached = self._contents.get(key)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                self._contents.move_to_end(key)
+                return cached[2]
+
+        content = filepath.read_text(encoding="utf-8")
+        with self._index_lock:
+            self._cache_content(key, st, content)
+        return content
 
     def write(self, filename: str, content: str, append: bool = False) -> str:
         """
@@ -82,10 +153,11 @@ class DocumentManager:
         filepath = self._get_path(filename)
 
         if append and filepath.exists():
-            existing = filepath.read_text(encoding="utf-8")
+            existing = self.read(filename)
             content = existing + "\n" + content
 
         filepath.write_text(content, encoding="utf-8")
+        self._update_index(filepath, content)
         return str(filepath)
 
     def delete(self, filename: str) -> bool:
@@ -103,6 +175,10 @@ class DocumentManager:
             return False
 
         filepath.unlink()
+        if (key := self._index_key(filepath)) is not None:
+            with self._index_lock:
+                self._index.pop(key, None)
+                self._contents.pop(key, None)
         return True
 
     def list_files(self) -> list[str]:
@@ -112,7 +188,12 @@ class DocumentManager:
         Returns:
             文件名列表
         """
-        return [f.name for f in self.base_dir.glob("*.md")]
+        # 目录未发生增删时直接使用索引，避免每次都遍历目录
+        dir_mtime = os.stat(self.base_dir).st_mtime_ns
+        with self._index_lock:
+            if dir_mtime != self._dir_mtime:
+                self._refresh()
+            return list(self._index)
 
     def exists(self, filename: str) -> bool:
         """检查文件是否存在"""
@@ -124,6 +205,8 @@ class MarkdownToWordConverter:
 
     def __init__(self):
         self.doc = None
+        # 转换过程依赖实例状态 self.doc，共享实例在多线程中调用时需串行化
+        self._lock = threading.Lock()
 
     def convert(self, markdown_content: str, output_path: str) -> str:
         """
@@ -136,6 +219,11 @@ class MarkdownToWordConverter:
         Returns:
             生成的 Word 文件路径
         """
+        with self._lock:
+            return self._convert(markdown_content, output_path)
+
+    def _convert(self, markdown_content: str, output_path: str) -> str:
+        """convert 的实际实现，调用方需持有锁"""
         self.doc = Document()
 
         lines = markdown_content.split("\n")
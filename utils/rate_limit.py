@@ -0,0 +1,91 @@
+"""
+限流工具
+
+支持：
+- 令牌桶限速 (TokenBucket)
+- 并发上限 + 限速组合 (RequestLimiter)
+- 429 限流错误识别与带抖动的指数退避
+"""
+
+import asyncio
+import random
+import re
+import time
+
+# 错误信息中独立出现的 429 状态码（不匹配 4290 等数字的一部分）
+_STATUS_429_RE = re.compile(r"\b429\b")
+
+
+class TokenBucket:
+    """异步令牌桶，按固定速率补充令牌，用于限制每秒请求数"""
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """
+        初始化令牌桶
+
+        Args:
+            rate: 每秒补充的令牌数
+            capacity: 桶容量（允许的突发请求数），默认与 rate 相同
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """获取一个令牌，令牌不足时等待（等待者按先后顺序获取）"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class RequestLimiter:
+    """并发上限 + 令牌桶限速，作为异步上下文管理器包裹每次请求"""
+
+    def __init__(self, max_inflight: int = 8, rps: float = 5):
+        """
+        初始化请求限制器
+
+        Args:
+            max_inflight: 同时进行中的最大请求数
+            rps: 每秒最多发起的请求数
+        """
+        self._sem = asyncio.Semaphore(max_inflight)
+        self._bucket = TokenBucket(rps)
+
+    async def __aenter__(self):
+        await self._sem.acquire()
+        try:
+            await self._bucket.acquire()
+        except BaseException:
+            self._sem.release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._sem.release()
+
+
+def is_rate_limited_error(error: BaseException) -> bool:
+    """判断异常是否为上游的 429 / 配额耗尽错误"""
+    status = getattr(error, "status", None) or getattr(error, "status_code", None) or getattr(error, "code", None)
+    if status == 429:
+        return True
+    message = str(error).lower()
+    if _STATUS_429_RE.search(message):
+        return True
+    return any(s in message for s in ("rate limit", "too many requests", "resource_exhausted"))
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """第 attempt 次重试前的等待时间：指数退避 + 随机抖动"""
+    return min(base * (2 ** attempt), cap) + random.uniform(0, 0.5)
@@ -7,9 +7,29 @@
 """
 
 import asyncio
+import hashlib
+import io
+import logging
+import multiprocessing
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from itertools import islice
+from typing import AsyncIterator, ClassVar, Sequence
 
 import aiohttp
-import xmltodict
+import diskcache
+import orjson
+from cachetools import TLRUCache
+from lxml import etree
+from yarl import URL
+
+from .rate_limit import backoff_delay
+
+# 与 AstrBot 的 astrbot.api.logger 是同一个 logger，独立运行时同样可用
+logger = logging.getLogger("astrbot")
 
 # ================= 代码测试配置区域 =================
 # 你的 Cloudflare Worker 地址
@@ -20,114 +40,516 @@ WORKER_URL = ""
 S2_API_KEY = None
 # ===========================================
 
+_NO_ABSTRACT = "无摘要"
+# Semantic Scholar 默认请求的字段，authors.name 只返回作者名，不含 authorId 等子对象
+S2_DEFAULT_FIELDS = "title,abstract,year,authors.name,openAccessPdf,externalIds"
+
+# arXiv 查询结果的磁盘缓存，键带格式版本，结果结构变化时旧条目自然失效；
+# 与用户文档目录分开存放
+ARXIV_CACHE_VERSION = 2
+ARXIV_CACHE_DIR = "./data/plugin_data/astrbot_plugin_AssistantResearchTeam_cache/arxiv_cache"
+ARXIV_CACHE_TTL = 6 * 3600
+ARXIV_CACHE_SIZE_LIMIT = 100 * 1024 * 1024
+
+# 限流 (429) 与服务端错误 (5xx) 的重试策略，总等待时间有上限，避免拖慢整个研究流程
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_MAX_ATTEMPTS = 4
+RETRY_MAX_DELAY = 30.0
+RETRY_BUDGET = 30.0
+# 限流响应未给出 Retry-After 时，建议调用方等待的时间（秒）
+DEFAULT_RETRY_AFTER = 60.0
+RATE_LIMITED_CODE = "agent.rate_limited"
+
+_ATOM_NS = {"a": "http://www.w3.org/2005/Atom"}
+_ATOM_ENTRY = "{http://www.w3.org/2005/Atom}entry"
+# 预编译的 XPath，在 C 层完成每个 entry 的字段提取
+_XP_TITLE = etree.XPath("string(a:title)", namespaces=_ATOM_NS)
+_XP_SUMMARY = etree.XPath("string(a:summary)", namespaces=_ATOM_NS)
+_XP_PUBLISHED = etree.XPath("string(a:published)", namespaces=_ATOM_NS)
+_XP_ID = etree.XPath("string(a:id)", namespaces=_ATOM_NS)
+_XP_AUTHORS = etree.XPath("a:author/a:name/text()", namespaces=_ATOM_NS, smart_strings=False)
+
+# Content-Length 超过该大小的 arXiv 响应交给进程池解析，避免长时间持有 GIL 拖慢事件循环；
+# 其余响应边接收边解析
+PROCESS_PARSE_THRESHOLD = 512 * 1024
+# 流式解析时每次从连接读取的分块大小
+STREAM_CHUNK_SIZE = 64 * 1024
+# 单个响应允许的最大字节数，防止异常的代理/上游把超大响应读入内存
+MAX_RESPONSE_BYTES = 4 * 1024 * 1024
+# 同时进行的 arXiv 响应读取 + 解析数，与进程池宽度一致
+PARSE_CONCURRENCY = min(4, os.cpu_count() or 1)
+_XML_POOL: ProcessPoolExecutor | None = None
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """获取（按需创建）XML 解析进程池，使用 spawn 启动以避免在多线程进程中 fork"""
+    global _XML_POOL
+    if _XML_POOL is None:
+        _XML_POOL = ProcessPoolExecutor(
+            max_workers=PARSE_CONCURRENCY,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _XML_POOL
+
+
+class RateLimitedError(Exception):
+    """上游在重试用尽后仍返回限流 (429/503)"""
+
+    def __init__(self, status: int, retry_after: float):
+        super().__init__(f"HTTP {status}, retry after {retry_after:g}s")
+        self.status = status
+        self.retry_after = retry_after
+
+
+class ResponseTooLargeError(Exception):
+    """响应体超过允许的最大字节数"""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"response exceeds {max_bytes} bytes")
+        self.max_bytes = max_bytes
+
+
+@dataclass(frozen=True, slots=True)
+class PaperResult:
+    """单篇论文的搜索结果（不可变，缓存中可直接共享，无需拷贝）"""
+    source: str
+    title: str | None
+    authors: str
+    year: int | str | None
+    abstract: str
+    pdf_url: str | None
+
+
+def _rate_limited_result(source: str, message: str, retry_after: float) -> dict:
+    """构造结构化的限流结果，调用方可据 code / retry_after 安排重试而无需匹配错误文本"""
+    return {
+        "error": message,
+        "code": RATE_LIMITED_CODE,
+        "retry_after": retry_after,
+        "source": source
+    }
+
+
+def _collapse_ws(text: str) -> str:
+    """把换行、制表符等连续空白折叠为单个空格并去掉首尾空白（split/join 单次 C 层扫描，比正则快数倍）"""
+    return " ".join(text.split())
+
+
+def _format_authors(names: Sequence[str], limit: int = 5) -> str:
+    """拼接作者名，超过 limit 个时只保留前 limit 个并追加 et al."""
+    joined = ", ".join(islice(names, limit))
+    return joined + " et al." if len(names) > limit else joined
+
+
+def shutdown_parse_pool():
+    """关闭 XML 解析进程池"""
+    global _XML_POOL
+    if _XML_POOL is not None:
+        _XML_POOL.shutdown(wait=False, cancel_futures=True)
+        _XML_POOL = None
+
 
 class AcademicBaseTool:
-    def __init__(self, proxy_base_url: str, api_key: str | None = None):
+    # 所有工具实例共享同一个连接池，避免每次请求都重新建立 TCP/TLS 连接
+    _session: ClassVar[aiohttp.ClientSession | None] = None
+    _session_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
+    # 进程内的查询结果缓存，值为 (ttl, results)，过期时间由写入时的 ttl 决定
+    _memory_cache: ClassVar[TLRUCache] = TLRUCache(
+        maxsize=512, ttu=lambda _key, value, now: now + value[0]
+    )
+    # 限制同时进行的响应读取 + 解析数，避免大量并发查询同时解析多 MB 响应占满 CPU 和内存
+    parse_concurrency: ClassVar[int] = PARSE_CONCURRENCY
+    _parse_sem: ClassVar[asyncio.Semaphore | None] = None
+
+    def __init__(
+        self,
+        proxy_base_url: str,
+        api_key: str | None = None,
+        ttl: float = 600,
+        max_bytes: int = MAX_RESPONSE_BYTES
+    ):
+        """
+        Args:
+            proxy_base_url: 代理基础 URL
+            api_key: API Key（可选）
+            ttl: 进程内结果缓存的有效期（秒），学术元数据变化很慢，默认 10 分钟
+            max_bytes: 单个响应允许的最大字节数，超出时返回错误
+        """
         self.proxy_base_url = proxy_base_url.rstrip("/")
+        self.ttl = ttl
+        self.max_bytes = max_bytes
         self.headers = {"User-Agent": "Academic-Project-Bot/1.0"}
         if api_key:
             self.headers["x-api-key"] = api_key
 
+    def _cache_get(self, query: str, limit: int) -> tuple[PaperResult, ...] | None:
+        """读取进程内缓存"""
+        hit = AcademicBaseTool._memory_cache.get((type(self).__name__, query, limit))
+        return hit[1] if hit is not None else None
+
+    def _cache_put(self, query: str, limit: int, papers: list[PaperResult] | tuple[PaperResult, ...]):
+        """写入进程内缓存（PaperResult 不可变，无需拷贝）"""
+        if self.ttl <= 0:
+            return
+        AcademicBaseTool._memory_cache[(type(self).__name__, query, limit)] = (self.ttl, tuple(papers))
+
+    @classmethod
+    def set_parse_concurrency(cls, limit: int):
+        """设置同时进行的响应读取 + 解析数上限（对之后获取的信号量生效）"""
+        AcademicBaseTool.parse_concurrency = max(1, limit)
+        AcademicBaseTool._parse_sem = None
+
+    @classmethod
+    def _get_parse_sem(cls) -> asyncio.Semaphore:
+        """懒加载共享的解析信号量"""
+        if AcademicBaseTool._parse_sem is None:
+            AcademicBaseTool._parse_sem = asyncio.Semaphore(AcademicBaseTool.parse_concurrency)
+        return AcademicBaseTool._parse_sem
+
+    @classmethod
+    async def _get_session(cls) -> aiohttp.ClientSession:
+        """懒加载共享的 ClientSession"""
+        if cls._session is None or cls._session.closed:
+            async with cls._session_lock:
+                if cls._session is None or cls._session.closed:
+                    connector = aiohttp.TCPConnector(
+                        limit=100,
+                        limit_per_host=20,
+                        keepalive_timeout=30,
+                        ttl_dns_cache=300
+                    )
+                    cls._session = aiohttp.ClientSession(
+                        connector=connector,
+                        timeout=aiohttp.ClientTimeout(total=20)
+                    )
+        return cls._session
+
+    @staticmethod
+    def _retry_delay(resp: aiohttp.ClientResponse, attempt: int) -> float:
+        """优先遵循服务端的 Retry-After（秒），否则使用指数退避"""
+        try:
+            delay = float(resp.headers.get("Retry-After", "")) + random.uniform(0, 0.5)
+        except ValueError:
+            delay = backoff_delay(attempt)
+        return min(delay, RETRY_MAX_DELAY)
+
+    @staticmethod
+    def _retry_after(resp: aiohttp.ClientResponse) -> float:
+        """读取 Retry-After（秒），缺失或为 HTTP 日期格式时使用默认值"""
+        try:
+            return max(0.0, float(resp.headers.get("Retry-After", "")))
+        except ValueError:
+            return DEFAULT_RETRY_AFTER
+
+    async def _iter_capped(self, resp: aiohttp.ClientResponse) -> AsyncIterator[bytes]:
+        """分块读取响应体，累计超过 max_bytes 时抛出 ResponseTooLargeError"""
+        if (resp.content_length or 0) > self.max_bytes:
+            raise ResponseTooLargeError(self.max_bytes)
+        received = 0
+        async for chunk in resp.content.iter_chunked(STREAM_CHUNK_SIZE):
+            received += len(chunk)
+            if received > self.max_bytes:
+                raise ResponseTooLargeError(self.max_bytes)
+            yield chunk
+
+    async def _read_capped(self, resp: aiohttp.ClientResponse) -> bytes:
+        """读取完整响应体，大小受 max_bytes 限制"""
+        return b"".join([chunk async for chunk in self._iter_capped(resp)])
+
+    @asynccontextmanager
+    async def _request(self, endpoint: str, params: dict) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        发起 GET 请求，遇到 429/5xx 时按 Retry-After 或指数退避重试
+
+        重试次数或总等待时间用尽后，把最后一次响应交给调用方处理。
+        """
+        session = await AcademicBaseTool._get_session()
+        # 查询参数只编码一次，重试时复用同一个 URL
+        url = URL(endpoint).with_query(params)
+        waited = 0.0
+        for attempt in range(RETRY_MAX_ATTEMPTS):
+            resp = await session.get(url, headers=self.headers)
+            if resp.status in RETRY_STATUSES and attempt < RETRY_MAX_ATTEMPTS - 1:
+                delay = self._retry_delay(resp, attempt)
+                if waited + delay <= RETRY_BUDGET:
+                    resp.release()
+                    waited += delay
+                    await asyncio.sleep(delay)
+                    continue
+            try:
+                yield resp
+            finally:
+                resp.release()
+            return
+
+    async def warmup(self, timeout: float = 2):
+        """预先解析代理域名并建立连接（DNS 结果由连接器缓存），使第一次查询复用热连接"""
+        if not self.proxy_base_url:
+            return
+        session = await AcademicBaseTool._get_session()
+        try:
+            async with session.head(
+                self.proxy_base_url, headers=self.headers, timeout=aiohttp.ClientTimeout(total=timeout)
+            ):
+                pass
+        except Exception:
+            pass
+
+    @classmethod
+    async def close_session(cls):
+        """关闭共享的 ClientSession，插件卸载时调用"""
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
+
 
 class SemanticScholarTool(AcademicBaseTool):
-    async def search(self, query: str, limit: int = 3) -> list[dict]:
+    async def search(
+        self,
+        query: str,
+        limit: int = 3,
+        fields: str | None = None,
+        abstract_chars: int | None = None
+    ) -> list[dict]:
+        """
+        Args:
+            query: 查询文本
+            limit: 返回结果数
+            fields: 请求的 S2 字段（逗号分隔），默认 S2_DEFAULT_FIELDS；不请求的字段在结果中为空
+            abstract_chars: 摘要最多保留的字符数，None 表示不截断
+        """
         endpoint = f"{self.proxy_base_url}/s2/graph/v1/paper/search"
+        fields = fields or S2_DEFAULT_FIELDS
         params = {
             "query": query,
             "limit": limit,
-            "fields": "title,abstract,year,authors,openAccessPdf,externalIds"
+            "fields": fields
         }
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    endpoint,
-                    params=params,
-                    headers=self.headers,
-                    timeout=aiohttp.ClientTimeout(total=20)
-                ) as resp:
-                    if resp.status == 429:
-                        return [{"error": "请求太快被限制了 (等待 API Key 中...)"}]
-
-                    resp.raise_for_status()
-                    data = await resp.json()
-
-            results = []
-            for item in data.get("data", []):
-                # 提取作者列表
-                authors = item.get("authors", [])
-                author_names = ", ".join([a.get("name", "") for a in authors[:5]])
-                if len(authors) > 5:
-                    author_names += " et al."
-
-                # 优先使用 openAccessPdf，否则尝试从 externalIds 构造 arXiv 链接
-                pdf_url = None
-                if item.get("openAccessPdf"):
-                    pdf_url = item["openAccessPdf"].get("url")
-                elif item.get("externalIds", {}).get("ArXiv"):
-                    arxiv_id = item["externalIds"]["ArXiv"]
-                    pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
-
-                results.append({
-                    "source": "Semantic Scholar",
-                    "title": item.get("title"),
-                    "authors": author_names,
-                    "year": item.get("year"),
-                    "abstract": item.get("abstract") or "无摘要",
-                    "pdf_url": pdf_url
-                })
-            return results
-        except Exception as e:
-            return [{"error": f"S2 Error: {str(e)}"}]
+        cache_key = query if fields == S2_DEFAULT_FIELDS else f"{query}|{fields}"
+        if (papers := self._cache_get(cache_key, limit)) is None:
+            try:
+                papers = await self._search(endpoint, params)
+            except RateLimitedError as e:
+                return [_rate_limited_result(
+                    "Semantic Scholar", "请求太快被限制了 (等待 API Key 中...)", e.retry_after
+                )]
+            except Exception as e:
+                return [{"error": f"S2 Error: {str(e)}"}]
+            self._cache_put(cache_key, limit, papers)
+
+        results = [asdict(p) for p in papers]
+        if abstract_chars is not None:
+            for r in results:
+                if r["abstract"] != _NO_ABSTRACT:
+                    r["abstract"] = r["abstract"][:abstract_chars]
+        return results
+
+    async def search_many(
+        self, queries: list[str], limit: int = 3, concurrency: int = 4
+    ) -> dict[str, list[dict]]:
+        """
+        批量搜索多个查询
+
+        S2 的 /paper/batch 只支持按论文 ID 查询，不能批量搜索关键词，
+        这里对查询去重后在共享连接池上并发请求，并限制同时进行的请求数以降低 429 风险。
+
+        Args:
+            queries: 查询列表
+            limit: 每个查询返回的结果数
+            concurrency: 同时进行的最大请求数
+
+        Returns:
+            查询 -> 结果列表
+        """
+        unique = list(dict.fromkeys(queries))
+        sem = asyncio.Semaphore(max(1, concurrency))
+
+        async def run(query: str) -> list[dict]:
+            async with sem:
+                return await self.search(query, limit)
+
+        results = await asyncio.gather(*(run(q) for q in unique))
+        return dict(zip(unique, results))
+
+    async def _search(self, endpoint: str, params: dict) -> list[PaperResult]:
+        """请求 S2 搜索接口并整理结果"""
+        async with self._request(endpoint, params) as resp:
+            if resp.status == 429:
+                raise RateLimitedError(resp.status, self._retry_after(resp))
+
+            resp.raise_for_status()
+            # S2 返回 UTF-8 JSON，orjson 解码明显快于标准库 json
+            data = orjson.loads(await self._read_capped(resp))
+
+        papers = []
+        for item in data.get("data", []):
+            # 优先使用 openAccessPdf，否则尝试从 externalIds 构造 arXiv 链接
+            pdf_url = None
+            if oap := item.get("openAccessPdf"):
+                pdf_url = oap.get("url")
+            elif arxiv_id := (item.get("externalIds") or {}).get("ArXiv"):
+                pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
+
+            papers.append(PaperResult(
+                source="Semantic Scholar",
+                title=item.get("title"),
+                authors=_format_authors([a.get("name", "") for a in item.get("authors", [])]),
+                year=item.get("year"),
+                abstract=item.get("abstract") or _NO_ABSTRACT,
+                pdf_url=pdf_url
+            ))
+        return papers
+
+
+def _entry_to_result(entry) -> PaperResult:
+    """把一个 Atom <entry> 节点转换为 PaperResult"""
+    return PaperResult(
+        source="ArXiv",
+        title=_collapse_ws(_XP_TITLE(entry)),
+        authors=_format_authors(_XP_AUTHORS(entry)),
+        year=_XP_PUBLISHED(entry)[:4],  # 提取年份
+        abstract=_collapse_ws(_XP_SUMMARY(entry)),
+        pdf_url=_XP_ID(entry).replace("abs", "pdf")
+    )
+
+
+def _release_entry(entry):
+    """释放已处理的节点，保持内存占用恒定"""
+    entry.clear()
+    while entry.getprevious() is not None:
+        del entry.getparent()[0]
+
+
+def _parse_arxiv_feed(content: bytes) -> list[PaperResult]:
+    """流式解析 arXiv Atom 响应为结果列表（同步，应在线程池或进程池中调用）"""
+    results = []
+    for _, entry in etree.iterparse(io.BytesIO(content), tag=_ATOM_ENTRY, resolve_entities=False):
+        results.append(_entry_to_result(entry))
+        _release_entry(entry)
+    return results
 
 
 class ArxivTool(AcademicBaseTool):
+    # 进行中的请求 (endpoint, query, max_results) -> Task，相同请求并发到达时共享同一次网络请求
+    _inflight: ClassVar[dict[tuple[str, str, int], asyncio.Task]] = {}
+    _disk_cache: ClassVar[diskcache.Cache | None] = None
+
+    @classmethod
+    def _get_disk_cache(cls) -> diskcache.Cache:
+        """懒加载磁盘缓存，超出容量后按 LRU 淘汰"""
+        if cls._disk_cache is None:
+            cls._disk_cache = diskcache.Cache(
+                ARXIV_CACHE_DIR,
+                size_limit=ARXIV_CACHE_SIZE_LIMIT,
+                eviction_policy="least-recently-used"
+            )
+        return cls._disk_cache
+
+    @classmethod
+    def close_cache(cls):
+        """关闭磁盘缓存，插件卸载时调用"""
+        if cls._disk_cache is not None:
+            cls._disk_cache.close()
+            cls._disk_cache = None
+
     async def search(self, query: str, max_results: int = 3) -> list[dict]:
+        # LLM 传入的工具参数可能是字符串或缺失，统一转换为正整数
+        try:
+            max_results = max(1, int(max_results))
+        except (TypeError, ValueError):
+            max_results = 3
+
+        # 先查进程内缓存，再查磁盘缓存，命中时跳过网络请求和 XML 解析
+        if (papers := self._cache_get(query, max_results)) is None:
+            key = hashlib.sha1(
+                f"v{ARXIV_CACHE_VERSION}|{query}|{max_results}".encode("utf-8")
+            ).hexdigest()
+            papers = await self._disk_get(key)
+            if papers is None:
+                # 错误结果不缓存
+                try:
+                    papers = await self._search_shared(query, max_results)
+                except RateLimitedError as e:
+                    return [_rate_limited_result("ArXiv", f"ArXiv Error: {str(e)}", e.retry_after)]
+                except Exception as e:
+                    return [{"error": f"ArXiv Error: {str(e)}"}]
+                await self._disk_set(key, papers)
+            self._cache_put(query, max_results, papers)
+
+        return [asdict(p) for p in papers]
+
+    @classmethod
+    async def _disk_get(cls, key: str) -> list[PaperResult] | None:
+        """读取磁盘缓存，缓存不可用（目录不可写、数据库被锁、反序列化失败等）时视为未命中"""
+        try:
+            return await asyncio.to_thread(cls._get_disk_cache().get, key)
+        except Exception as e:
+            logger.warning(f"[ArxivTool] 磁盘缓存读取失败，跳过缓存: {e}")
+            return None
+
+    @classmethod
+    async def _disk_set(cls, key: str, papers: list[PaperResult]):
+        """写入磁盘缓存，失败时只记录日志，不影响本次结果"""
+        try:
+            await asyncio.to_thread(cls._get_disk_cache().set, key, papers, expire=ARXIV_CACHE_TTL)
+        except Exception as e:
+            logger.warning(f"[ArxivTool] 磁盘缓存写入失败: {e}")
+
+    async def _search_shared(self, query: str, max_results: int) -> list[PaperResult]:
+        """相同的请求正在进行时直接等待其结果，否则发起新请求"""
+        key = (f"{self.proxy_base_url}/arxiv/api/query", query, max_results)
+        task = ArxivTool._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(f"all:{query}", max_results))
+            ArxivTool._inflight[key] = task
+            task.add_done_callback(lambda t: ArxivTool._finish_inflight(key, t))
+        # shield：某个调用方被取消时不影响其他等待同一请求的调用方
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _finish_inflight(key: tuple[str, str, int], task: asyncio.Task):
+        """请求结束后移出进行中列表，并取走异常避免所有等待者都被取消时告警"""
+        ArxivTool._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch(self, search_query: str, max_results: int) -> list[PaperResult]:
+        """请求 arXiv API 并解析结果"""
         endpoint = f"{self.proxy_base_url}/arxiv/api/query"
         params = {
-            "search_query": f"all:{query}",
+            "search_query": search_query,
             "start": 0,
             "max_results": max_results
         }
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    endpoint,
-                    params=params,
-                    headers=self.headers,
-                    timeout=aiohttp.ClientTimeout(total=20)
-                ) as resp:
-                    resp.raise_for_status()
-                    content = await resp.read()
-
-            # xmltodict 是同步的，在线程池中运行
-            loop = asyncio.get_event_loop()
-            data = await loop.run_in_executor(None, xmltodict.parse, content)
-
-            entries = data.get("feed", {}).get("entry", [])
-            if isinstance(entries, dict):
-                entries = [entries]
-
-            results = []
-            for entry in entries:
-                # 提取作者列表
-                authors_data = entry.get("author", [])
-                if isinstance(authors_data, dict):
-                    authors_data = [authors_data]
-                author_names = ", ".join([a.get("name", "") for a in authors_data[:5]])
-                if len(authors_data) > 5:
-                    author_names += " et al."
-
-                results.append({
-                    "source": "ArXiv",
-                    "title": entry.get("title", "").replace("\n", "").strip(),
-                    "authors": author_names,
-                    "year": entry.get("published", "")[:4],  # 提取年份
-                    "abstract": entry.get("summary", "").replace("\n", " "),
-                    "pdf_url": entry.get("id", "").replace("abs", "pdf")
-                })
-            return results
-        except Exception as e:
-            return [{"error": f"ArXiv Error: {str(e)}"}]
+        async with self._request(endpoint, params) as resp:
+            if resp.status in (429, 503):
+                raise RateLimitedError(resp.status, self._retry_after(resp))
+            resp.raise_for_status()
+
+            # 信号量只限制读取 + 解析，不包含请求与重试等待，被限流的查询不会占住名额
+            async with self._get_parse_sem():
+                if (resp.content_length or 0) <= PROCESS_PARSE_THRESHOLD:
+                    return await self._parse_stream(resp)
+
+                # 已知的大响应整体读取后交给进程池解析，避免长时间占用事件循环
+                content = await self._read_capped(resp)
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(_get_parse_pool(), _parse_arxiv_feed, content)
+
+    async def _parse_stream(self, resp: aiohttp.ClientResponse) -> list[PaperResult]:
+        """边接收边解析 Atom 响应，解析与网络读取重叠，内存占用与响应大小无关"""
+        parser = etree.XMLPullParser(events=("end",), tag=_ATOM_ENTRY, resolve_entities=False)
+        results = []
+        async for chunk in self._iter_capped(resp):
+            # 单个分块的解析很短，直接在事件循环上进行
+            parser.feed(chunk)
+            for _, entry in parser.read_events():
+                results.append(_entry_to_result(entry))
+                _release_entry(entry)
+        parser.close()
+        for _, entry in parser.read_events():
+            results.append(_entry_to_result(entry))
+        return results
 
 
 # --- 测试运行 ---
@@ -148,22 +570,37 @@ if __name__ == "__main__":
         print()
 
     async def main():
-        # 1. 测试 ArXiv (应该 100% 成功)
-        print("\n" + "=" * 60)
-        print(">>> Testing ArXiv (No Key required)...")
-        print("=" * 60)
         arxiv = ArxivTool(WORKER_URL)
-        results = await arxiv.search("LLM Agents")
-        for r in results:
-            print_result(r)
+        s2 = SemanticScholarTool(WORKER_URL, api_key=S2_API_KEY)
+        # 两个数据源互不依赖，并发请求
+        arxiv_res, s2_res = await asyncio.gather(
+            arxiv.search("LLM Agents"),
+            s2.search("LLM Agents"),
+            return_exceptions=True
+        )
 
+        # 1. 测试 ArXiv (应该 100% 成功)
         # 2. 测试 Semantic Scholar (没 Key 可能会 429，但也可能成功)
-        print("\n" + "=" * 60)
-        print(">>> Testing Semantic Scholar...")
-        print("=" * 60)
-        s2 = SemanticScholarTool(WORKER_URL, api_key=S2_API_KEY)
-        results = await s2.search("LLM Agents")
-        for r in results:
-            print_result(r)
+        for title, results in (
+            (">>> Testing ArXiv (No Key required)...", arxiv_res),
+            (">>> Testing Semantic Scholar...", s2_res),
+        ):
+            print("\n" + "=" * 60)
+            print(title)
+            print("=" * 60)
+            if isinstance(results, BaseException):
+                results = [{"error": f"{type(results).__name__}: {results}"}]
+            for r in results:
+                print_result(r)
+
+        await AcademicBaseTool.close_session()
+        ArxivTool.close_cache()
+        shutdown_parse_pool()
 
-    asyncio.run(main())
+    # 独立运行时可用 uvloop 加速事件循环；作为插件加载时事件循环由 AstrBot 管理
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -0,0 +1,158 @@
+"""
+语义缓存 (Semantic Cache)
+
+对 LLM 搜索结果做缓存：
+- 使用本地小模型 (sentence-transformers) 计算查询向量
+- 与已缓存查询的余弦相似度超过阈值时直接返回缓存结果
+- LRU 淘汰 + 过期时间
+- 未安装 sentence-transformers 或模型尚未加载完成时，退化为规范化文本的精确匹配
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
+# 与 AstrBot 的 astrbot.api.logger 是同一个 logger
+logger = logging.getLogger("astrbot")
+
+DEFAULT_EMBED_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+class SemanticCache:
+    """基于查询向量相似度的内存 LRU 缓存"""
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        max_entries: int = 1024,
+        ttl: float = 24 * 3600,
+        model_name: str = DEFAULT_EMBED_MODEL,
+    ):
+        """
+        初始化语义缓存
+
+        Args:
+            threshold: 命中所需的最小余弦相似度
+            max_entries: 最大缓存条数，超出后按 LRU 淘汰
+            ttl: 缓存有效期（秒）
+            model_name: 用于计算查询向量的 sentence-transformers 模型
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.model_name = model_name
+        self._model = None
+        # key -> (embedding, response, ts)，embedding 已归一化
+        self._entries: OrderedDict[str, tuple] = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    def load_model(self) -> bool:
+        """
+        加载向量模型（同步，耗时较长，应在线程池中调用）
+
+        Returns:
+            是否成功加载；失败时缓存退化为精确匹配
+        """
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            logger.warning("[SemanticCache] sentence-transformers 未安装，退化为精确匹配缓存")
+            return False
+
+        try:
+            self._model = SentenceTransformer(self.model_name)
+        except Exception as e:
+            logger.warning(f"[SemanticCache] 模型加载失败，退化为精确匹配缓存: {e}")
+            self._model = None
+            return False
+        return True
+
+    @staticmethod
+    def _normalize(query: str) -> str:
+        """规范化查询文本，作为精确匹配的键"""
+        return " ".join(query.lower().split())
+
+    def _embed(self, query: str):
+        """计算归一化后的查询向量"""
+        return self._model.encode(query, normalize_embeddings=True)
+
+    def _evict_expired(self, now: float):
+        """移除过期条目（OrderedDict 按访问顺序排列，需全量检查）"""
+        expired = [k for k, (_, _, ts) in self._entries.items() if now - ts > self.ttl]
+        for k in expired:
+            del self._entries[k]
+
+    async def embed(self, query: str):
+        """
+        计算查询向量，供 get / put 复用，避免同一查询重复编码
+
+        Args:
+            query: 查询文本
+
+        Returns:
+            归一化后的向量；模型未加载时返回 None
+        """
+        if self._model is None:
+            return None
+        return await asyncio.to_thread(self._embed, query)
+
+    async def get(self, query: str, vec=None) -> str | None:
+        """
+        查询缓存
+
+        Args:
+            query: 查询文本
+            vec: 预先由 embed() 计算的查询向量，为 None 时按需计算
+
+        Returns:
+            命中时返回缓存的回复，否则返回 None
+        """
+        key = self._normalize(query)
+        if vec is None:
+            vec = await self.embed(query)
+
+        async with self._lock:
+            now = time.time()
+            self._evict_expired(now)
+
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key][1]
+
+            if vec is None or not self._entries:
+                return None
+
+            # 线性扫描：条目数有上限，向量已归一化，点积即余弦相似度
+            best_key, best_score = None, -1.0
+            for k, (emb, _, _) in self._entries.items():
+                if emb is None:
+                    continue
+                score = float(vec @ emb)
+                if score > best_score:
+                    best_key, best_score = k, score
+
+            if best_key is None or best_score < self.threshold:
+                return None
+
+            self._entries.move_to_end(best_key)
+            return self._entries[best_key][1]
+
+    async def put(self, query: str, response: str, vec=None):
+        """
+        写入缓存
+
+        Args:
+            query: 查询文本
+            response: LLM 回复
+            vec: 查询时已计算的向量，为 None 时按需计算
+        """
+        key = self._normalize(query)
+        if vec is None:
+            vec = await self.embed(query)
+
+        async with self._lock:
+            self._entries[key] = (vec, response, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
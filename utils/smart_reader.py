@@ -8,16 +8,66 @@
 """
 
 import asyncio
+import hashlib
+import logging
 import re
 from dataclasses import dataclass, field
 from urllib.parse import urlparse
 
 import aiohttp
+import diskcache
 import pymupdf
 import trafilatura
-from playwright.async_api import async_playwright
+from markdownify import markdownify
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+from selectolax.lexbor import LexborHTMLParser
 from trafilatura.metadata import extract_metadata
 
+# 与 AstrBot 的 astrbot.api.logger 是同一个 logger
+logger = logging.getLogger("astrbot")
+
+# 全局共享的 Playwright 实例与浏览器，由插件 initialize/terminate 管理生命周期
+_playwright: Playwright | None = None
+_browser: Browser | None = None
+_browser_lock = asyncio.Lock()
+
+# 预热的 BrowserContext 池：队列容量即最大并发页面数，每个上下文使用若干次后轮换
+CONTEXT_POOL_SIZE = 4
+CONTEXT_MAX_USES = 20
+# 等待空闲上下文的最长时间（秒）
+CONTEXT_ACQUIRE_TIMEOUT = 60
+_context_pool: asyncio.Queue | None = None
+_context_uses: dict[BrowserContext, int] = {}
+# 属于当前浏览器的上下文总数（池中 + 使用中），补充失败时低于 _pool_size，取用时按需补足
+_pool_size = CONTEXT_POOL_SIZE
+_context_count = 0
+
+# URL -> Markdown 的磁盘缓存，命中前通过条件请求 (ETag/Last-Modified/正文哈希) 校验；
+# 与用户文档目录分开存放，不会出现在文档处理/发送文件工具的操作范围内
+READ_CACHE_DIR = "./data/plugin_data/astrbot_plugin_AssistantResearchTeam_cache/smart_reader_cache"
+READ_CACHE_TTL = 7 * 24 * 3600
+READ_CACHE_SIZE_LIMIT = 200 * 1024 * 1024
+_read_cache: diskcache.Cache | None = None
+
+# 静态页面、PDF 下载与缓存校验共享的 HTTP 连接池
+_http_session: aiohttp.ClientSession | None = None
+_HTTP_HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+
+# 结构固定站点的快速提取规则：域名 -> (正文选择器, 需要移除的子节点选择器)
+# 命中时直接用 lexbor 取正文，跳过 Trafilatura 的完整 DOM 分析
+_WIKIPEDIA_RULE = (
+    "#mw-content-text .mw-parser-output",
+    ("style", "script", ".mw-editsection", ".navbox", ".reflist", ".reference",
+     "table.infobox", ".hatnote", ".metadata"),
+)
+FAST_SELECTORS: dict[str, tuple[str, tuple[str, ...]]] = {
+    "arxiv.org": ("blockquote.abstract", ("span.descriptor",)),
+    "en.wikipedia.org": _WIKIPEDIA_RULE,
+    "zh.wikipedia.org": _WIKIPEDIA_RULE,
+}
+# 快速提取结果过短时认为规则失效，回退到 Trafilatura
+_FAST_MIN_LENGTH = 50
+
 
 @dataclass
 class ReadResult:
@@ -30,31 +80,174 @@ class ReadResult:
     content_type: str = "html"  # html 或 pdf
     references: list[str] = field(default_factory=list)  # 引用列表
     error: str | None = None
+    validators: dict = field(default_factory=dict)  # 缓存校验信息 (etag/last_modified/body_sha1)
+
+
+def _response_validators(headers, body: bytes | None = None) -> dict:
+    """从响应头提取缓存校验信息，服务器不提供 ETag/Last-Modified 时才使用原始正文的 sha1"""
+    etag = headers.get("etag")
+    last_modified = headers.get("last-modified")
+    body_sha1 = None
+    if not (etag or last_modified) and body is not None:
+        body_sha1 = hashlib.sha1(body).hexdigest()
+    return {"etag": etag, "last_modified": last_modified, "body_sha1": body_sha1}
+
+
+def _get_http_session() -> aiohttp.ClientSession:
+    """懒加载共享的 ClientSession"""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(headers=_HTTP_HEADERS)
+    return _http_session
+
+
+async def close_http_session():
+    """关闭共享的 ClientSession，插件卸载时调用"""
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+
+
+async def _new_context(browser: Browser) -> BrowserContext:
+    """创建一个带统一指纹设置的 BrowserContext"""
+    context = await browser.new_context(
+        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        viewport={"width": 1920, "height": 1080},
+        locale="zh-CN",
+        timezone_id="Asia/Shanghai",
+    )
+    # 隐藏 webdriver 特征（对该上下文中的所有页面生效）
+    await context.add_init_script("""
+        Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+    """)
+    _context_uses[context] = 0
+    return context
+
+
+async def start_browser(pool_size: int = CONTEXT_POOL_SIZE) -> Browser:
+    """启动（或复用）全局共享的无头浏览器，并预热 BrowserContext 池"""
+    global _playwright, _browser, _context_pool, _pool_size, _context_count
+    if _browser is not None and _browser.is_connected():
+        return _browser
+
+    async with _browser_lock:
+        if _browser is None or not _browser.is_connected():
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(headless=True)
+
+            # 浏览器（重新）启动后旧的上下文全部失效，清空后重新填充；
+            # 复用同一个队列，正在等待上下文的调用不会被挂起
+            _context_uses.clear()
+            if _context_pool is None:
+                _context_pool = asyncio.Queue()
+            while not _context_pool.empty():
+                _context_pool.get_nowait()
+            _pool_size = pool_size
+            _context_count = 0
+            for _ in range(pool_size):
+                _context_pool.put_nowait(await _new_context(_browser))
+                _context_count += 1
+    return _browser
+
+
+async def close_browser():
+    """关闭全局共享的浏览器与 Playwright 实例"""
+    global _playwright, _browser, _context_pool, _context_count
+    async with _browser_lock:
+        _context_pool = None
+        _context_uses.clear()
+        _context_count = 0
+        if _browser is not None:
+            await _browser.close()
+            _browser = None
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
+
+
+async def _release_context(context: BrowserContext, discard: bool = False):
+    """归还上下文；使用次数过多或出错时关闭并补充一个新的上下文"""
+    global _context_count
+    pool = _context_pool
+    uses = _context_uses.get(context, CONTEXT_MAX_USES) + 1
+
+    # 浏览器已关闭或已重启，该上下文不再属于当前池
+    if pool is None or context.browser is not _browser:
+        _context_uses.pop(context, None)
+        return
+
+    if discard or uses >= CONTEXT_MAX_USES:
+        _context_uses.pop(context, None)
+        _context_count -= 1
+        try:
+            await context.close()
+        except Exception:
+            pass
+        try:
+            context = await _new_context(_browser)
+        except Exception:
+            # 补充失败时池容量暂时减一，下次取用时由 _acquire_context 按需补足
+            return
+        _context_count += 1
+    else:
+        _context_uses[context] = uses
+
+    pool.put_nowait(context)
+
+
+async def _acquire_context() -> BrowserContext:
+    """从池中取出一个上下文；池容量因补充失败而不足时直接新建，等待空闲上下文有超时"""
+    global _context_count
+    browser = await start_browser()
+    pool = _context_pool
+    if pool.empty() and _context_count < _pool_size:
+        _context_count += 1
+        try:
+            return await _new_context(browser)
+        except Exception:
+            _context_count -= 1
+            raise
+    try:
+        return await asyncio.wait_for(pool.get(), CONTEXT_ACQUIRE_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise TimeoutError(f"等待浏览器上下文超时 ({CONTEXT_ACQUIRE_TIMEOUT}s)") from None
 
 
-async def _fetch_html_with_playwright(url: str) -> str:
-    """使用 Playwright 异步获取渲染后的 HTML"""
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            viewport={"width": 1920, "height": 1080},
-            locale="zh-CN",
-            timezone_id="Asia/Shanghai",
-        )
-        page = await context.new_page()
-
-        # 隐藏 webdriver 特征
-        await page.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-        """)
+async def _fetch_html_with_playwright(url: str) -> tuple[str, dict]:
+    """从上下文池中取出一个预热的 BrowserContext 获取渲染后的 HTML 及主文档的缓存校验信息"""
+    context = await _acquire_context()
 
-        await page.goto(url, wait_until="networkidle", timeout=30000)
+    page = None
+    failed = False
+    try:
+        page = await context.new_page()
+        response = await page.goto(url, wait_until="networkidle", timeout=30000)
         await page.wait_for_load_state("domcontentloaded")
         html_content = await page.content()
-        await browser.close()
-
-    return html_content
+        validators = {}
+        if response is not None:
+            headers = await response.all_headers()
+            body = None
+            if not (headers.get("etag") or headers.get("last-modified")):
+                try:
+                    body = await response.body()
+                except Exception:
+                    pass
+            validators = _response_validators(headers, body)
+    except Exception:
+        failed = True
+        raise
+    finally:
+        if page is not None:
+            try:
+                await page.close()
+            except Exception:
+                failed = True
+        await _release_context(context, discard=failed)
+
+    return html_content, validators
 
 
 def _extract_references_from_text(text: str) -> list[str]:
@@ -82,38 +275,88 @@ def _extract_references_from_text(text: str) -> list[str]:
     return references[:50]  # 限制最多 50 条引用
 
 
+def _fast_extract(url: str, html_content: str) -> ReadResult | None:
+    """按站点规则快速提取正文和 citation_* 元数据，未命中规则时返回 None"""
+    host = (urlparse(url).hostname or "").lower()
+    rule = None
+    for domain, domain_rule in FAST_SELECTORS.items():
+        if host == domain or host.endswith("." + domain):
+            rule = domain_rule
+            break
+    if rule is None:
+        return None
+
+    selector, strip_selectors = rule
+    tree = LexborHTMLParser(html_content)
+    node = tree.css_first(selector)
+    if node is None:
+        return None
+    for strip_selector in strip_selectors:
+        for child in node.css(strip_selector):
+            child.decompose()
+
+    text_content = markdownify(node.html, heading_style="ATX").strip()
+    text_content = re.sub(r"\n{3,}", "\n\n", text_content)
+    if len(text_content) < _FAST_MIN_LENGTH:
+        return None
+
+    def meta(name: str) -> list[str]:
+        return [
+            m.attributes.get("content") or ""
+            for m in tree.css(f'meta[name="{name}"]')
+            if m.attributes.get("content")
+        ]
+
+    titles = meta("citation_title")
+    title_node = tree.css_first("title")
+    title = titles[0] if titles else (title_node.text(strip=True) if title_node else None)
+    authors = meta("citation_author")
+    dates = meta("citation_date")
+
+    return ReadResult(
+        content=text_content,
+        title=title or None,
+        author="; ".join(authors) or None,
+        publish_date=dates[0] if dates else None,
+        url=url,
+        content_type="html",
+        references=_extract_references_from_text(text_content)
+    )
+
+
 async def _read_html(url: str, use_playwright: bool = True) -> ReadResult:
     """异步读取 HTML 页面并提取内容"""
     try:
         if use_playwright:
-            html_content = await _fetch_html_with_playwright(url)
+            html_content, validators = await _fetch_html_with_playwright(url)
         else:
             # 使用 aiohttp 进行简单请求，适用于静态页面
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    headers={
-                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                    },
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    response.raise_for_status()
-                    html_content = await response.text()
+            async with _get_http_session().get(
+                url,
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                response.raise_for_status()
+                body = await response.read()
+                html_content = await response.text()
+                validators = _response_validators(response.headers, body)
+
+        # 已知站点走快速提取路径
+        fast_result = await asyncio.to_thread(_fast_extract, url, html_content)
+        if fast_result is not None:
+            fast_result.validators = validators
+            return fast_result
 
         # 提取元数据 (trafilatura 是同步的，在线程池中运行)
-        loop = asyncio.get_event_loop()
-        metadata = await loop.run_in_executor(None, extract_metadata, html_content)
+        metadata = await asyncio.to_thread(extract_metadata, html_content)
 
         # 提取正文并转为 Markdown
-        text_content = await loop.run_in_executor(
-            None,
-            lambda: trafilatura.extract(
-                html_content,
-                include_comments=False,
-                include_tables=True,
-                include_links=True,
-                output_format="markdown"
-            )
+        text_content = await asyncio.to_thread(
+            trafilatura.extract,
+            html_content,
+            include_comments=False,
+            include_tables=True,
+            include_links=True,
+            output_format="markdown"
         )
 
         if not text_content:
@@ -133,7 +376,8 @@ async def _read_html(url: str, use_playwright: bool = True) -> ReadResult:
             publish_date=metadata.date if metadata else None,
             url=url,
             content_type="html",
-            references=references
+            references=references,
+            validators=validators
         )
 
     except Exception as e:
@@ -144,20 +388,15 @@ async def _read_pdf(url: str) -> ReadResult:
     """异步读取 PDF 文件并提取内容"""
     try:
         # 异步下载 PDF
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                },
-                timeout=aiohttp.ClientTimeout(total=60)
-            ) as response:
-                response.raise_for_status()
-                pdf_bytes = await response.read()
+        async with _get_http_session().get(
+            url,
+            timeout=aiohttp.ClientTimeout(total=60)
+        ) as response:
+            response.raise_for_status()
+            pdf_bytes = await response.read()
+            validators = _response_validators(response.headers, pdf_bytes)
 
         # PyMuPDF 是同步的，在线程池中运行
-        loop = asyncio.get_event_loop()
-
         def parse_pdf(pdf_data: bytes) -> tuple:
             doc = pymupdf.open(stream=pdf_data, filetype="pdf")
 
@@ -185,9 +424,7 @@ async def _read_pdf(url: str) -> ReadResult:
             doc.close()
             return title, author, publish_date, full_text
 
-        title, author, publish_date, full_text = await loop.run_in_executor(
-            None, parse_pdf, pdf_bytes
-        )
+        title, author, publish_date, full_text = await asyncio.to_thread(parse_pdf, pdf_bytes)
 
         content = "\n\n".join(full_text)
 
@@ -204,7 +441,8 @@ async def _read_pdf(url: str) -> ReadResult:
             publish_date=publish_date,
             url=url,
             content_type="pdf",
-            references=references
+            references=references,
+            validators=validators
         )
 
     except Exception as e:
@@ -251,6 +489,66 @@ async def smart_read(url: str, use_playwright: bool = True) -> ReadResult:
         return await _read_html(url, use_playwright)
 
 
+def _get_read_cache() -> diskcache.Cache:
+    """懒加载阅读结果的磁盘缓存"""
+    global _read_cache
+    if _read_cache is None:
+        _read_cache = diskcache.Cache(
+            READ_CACHE_DIR,
+            size_limit=READ_CACHE_SIZE_LIMIT,
+            eviction_policy="least-recently-used"
+        )
+    return _read_cache
+
+
+def close_read_cache():
+    """关闭阅读结果的磁盘缓存，插件卸载时调用"""
+    global _read_cache
+    if _read_cache is not None:
+        _read_cache.close()
+        _read_cache = None
+
+
+async def _probe_url(url: str, entry: dict) -> bool:
+    """
+    发送轻量的条件请求，判断 URL 内容相对缓存是否未变化
+
+    缓存有 ETag/Last-Modified 时使用 HEAD 只比较校验头；
+    只有正文 sha1 时（服务器不提供校验头）才用 GET 下载原始正文比较。
+
+    Returns:
+        是否未变化
+    """
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+
+    method = "HEAD" if headers else "GET"
+    try:
+        async with _get_http_session().request(
+            method,
+            url,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            if response.status == 304:
+                return True
+            if response.status >= 400:
+                return False
+            if method == "GET":
+                return hashlib.sha1(await response.read()).hexdigest() == entry.get("body_sha1")
+
+            # 服务器忽略条件请求头时，逐项比较校验头
+            return any(
+                entry.get(k) and response.headers.get(h) == entry.get(k)
+                for k, h in (("etag", "ETag"), ("last_modified", "Last-Modified"))
+            )
+    except Exception:
+        return False
+
+
 async def smart_read_to_markdown(url: str, use_playwright: bool = True) -> str:
     """
     智能阅读并返回格式化的 Markdown 字符串 (异步)
@@ -262,6 +560,19 @@ async def smart_read_to_markdown(url: str, use_playwright: bool = True) -> str:
     Returns:
         str: 格式化的 Markdown 内容，包含元数据
     """
+    cache_key = f"{int(use_playwright)}|{url}"
+    try:
+        entry = await asyncio.to_thread(_get_read_cache().get, cache_key)
+    except Exception as e:
+        logger.warning(f"[SmartReader] 缓存读取失败，跳过缓存: {e}")
+        entry = None
+
+    # 有可校验的缓存且内容未变化时直接返回缓存，跳过浏览器渲染和正文提取；
+    # 没有缓存时不做探测，校验信息直接取自本次读取的响应
+    if entry and any(entry.get(k) for k in ("etag", "last_modified", "body_sha1")):
+        if await _probe_url(url, entry):
+            return entry["md"]
+
     result = await smart_read(url, use_playwright)
 
     if result.error:
@@ -299,7 +610,17 @@ async def smart_read_to_markdown(url: str, use_playwright: bool = True) -> str:
         for ref in result.references:
             output_parts.append(f"- {ref}")
 
-    return "\n\n".join(output_parts)
+    markdown = "\n\n".join(output_parts)
+
+    # 没有任何校验信息的结果以后无法确认是否过期，不写入缓存
+    if any(result.validators.get(k) for k in ("etag", "last_modified", "body_sha1")):
+        try:
+            await asyncio.to_thread(
+                _get_read_cache().set, cache_key, {**result.validators, "md": markdown}, expire=READ_CACHE_TTL
+            )
+        except Exception as e:
+            logger.warning(f"[SmartReader] 缓存写入失败: {e}")
+    return markdown
 
 
 # --- 测试 ---
@@ -312,5 +633,8 @@ if __name__ == "__main__":
         print("=" * 50)
         result = await smart_read_to_markdown(test_url)
         print(result[:2000])  # 只打印前 2000 字符
+        await close_browser()
+        await close_http_session()
+        close_read_cache()
 
     asyncio.run(main())